@@ -1,8 +1,22 @@
+import asyncio
+import hashlib
 import io
+import json
 import os
+import queue
 import subprocess
+import sys
 import threading
-import requests
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, InvalidStateError, ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
+from typing import Callable
+import httpx
+import ijson
+import orjson
+from PIL import Image, ImageTk
 from pathlib import Path
 from tkinter import messagebox
 import tkinter as tk
@@ -14,60 +28,310 @@ import shutil
 USER_PROFILE = os.getenv("USERPROFILE")
 LOCAL_SKIN_CACHE = os.path.join(USER_PROFILE, "Documents", "skin-cache")  # Répertoire pour les skins téléchargés
 GITHUB_ZIP_BASE = "https://raw.githubusercontent.com/darkseal-org/lol-skins/main/skins/"  # Base URL des skins GitHub
+CDRAGON_BASE = "https://raw.communitydragon.org/latest"  # Base URL des ressources CommunityDragon
+CDRAGON_GAME_DATA = f"{CDRAGON_BASE}/plugins/rcp-be-lol-game-data/global/default/v1"  # Données de jeu (JSON)
+CHAMPION_SUMMARY_URL = f"{CDRAGON_GAME_DATA}/champion-summary.json"  # Liste des champions
+CACHE_DIR = Path(LOCAL_SKIN_CACHE) / "_json"  # Cache disque des réponses JSON CommunityDragon
+IMG_CACHE_DIR = Path(LOCAL_SKIN_CACHE) / "_img"  # Cache disque des aperçus redimensionnés
+ZIP_META_DIR = Path(LOCAL_SKIN_CACHE) / "_zip"  # Validateurs HTTP (ETag / Last-Modified) des skins ZIP
+IMG_CACHE_SIZE = 64  # Nombre d'aperçus gardés en mémoire
+IMG_DISK_CACHE_SIZE = 500  # Nombre d'aperçus gardés sur disque
+PREVIEW_SIZE = (512, 288)  # Taille maximale des aperçus
+DDRAGON_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"  # Version du patch courant
+VERSION_CHECK_INTERVAL = 12 * 3600  # Intervalle (s) entre deux vérifications du patch
+DOWNLOAD_CHUNK_SIZE = 1 << 16  # Taille des blocs écrits sur disque pendant un téléchargement
+PREFETCH_CONCURRENCY = 16  # Requêtes simultanées max pour le préchargement des champions
+KEEPALIVE_EXPIRY = 120  # Durée (s) pendant laquelle une connexion inutilisée reste ouverte
 # ───────────────────────────────────────────────────────────────── #
 
+# ------------------------- Session HTTP ----------------------- #
+# Client partagé en HTTP/2 : les requêtes vers un même hôte (CommunityDragon, GitHub)
+# sont multiplexées sur une seule connexion, avec une seule poignée de main TLS.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=KEEPALIVE_EXPIRY)
+SESSION = httpx.Client(
+    # retries : nouvelle tentative en cas d'échec de connexion
+    transport=httpx.HTTPTransport(http2=True, limits=HTTP_LIMITS, retries=3),
+    timeout=30,
+    follow_redirects=True,
+    headers={"Accept-Encoding": "gzip, deflate"},
+)
+
+# Limites du client asynchrone utilisé pour les rafales de requêtes (préchargement)
+ASYNC_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=KEEPALIVE_EXPIRY)
+
+# Préchauffage : chaque client ouvre (DNS + TLS) la connexion qu'il utilisera ensuite.
+# SESSION n'a pas besoin de l'être pour CommunityDragon : le résumé des champions s'en charge.
+def warm_up_connections():
+    """Ouvre la connexion GitHub de SESSION avant le premier téléchargement de skin"""
+    try:
+        SESSION.head(GITHUB_ZIP_BASE, timeout=10)
+    except httpx.HTTPError:
+        pass  # simple préchauffage : l'erreur réelle sera remontée par la vraie requête
+
+async def warm_up_connections_async(client: httpx.AsyncClient):
+    """Ouvre la connexion CommunityDragon du client asynchrone pendant le chargement du résumé"""
+    try:
+        await client.head(f"{CDRAGON_BASE}/", timeout=10)
+    except httpx.HTTPError:
+        pass
+
 # ------------------------- Helpers ---------------------------- #
-def fetch_json(url: str):
-    """Récupère un fichier JSON depuis une URL"""
-    resp = requests.get(url, timeout=30)
+def _cache_file(url: str) -> Path:
+    """Chemin du fichier de cache JSON associé à une URL"""
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+def _zip_meta_file(url: str) -> Path:
+    """Chemin du fichier de validateurs associé à l'URL d'un skin ZIP"""
+    return ZIP_META_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.meta"
+
+def _write_atomic(path: Path, data: bytes):
+    """Écrit un fichier via un fichier temporaire pour ne jamais laisser de cache tronqué"""
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _conditional_headers(cache_file: Path, meta_file: Path | None = None) -> dict:
+    """En-têtes de revalidation pour une réponse déjà en cache
+
+    Ils reprennent l'ETag et le Last-Modified envoyés par le serveur (fichier ``.meta``),
+    jamais la date locale du fichier, qui dépend de l'horloge du client.
+    """
+    meta_file = meta_file or cache_file.with_suffix(".meta")
+    headers = {}
+    if cache_file.exists() and meta_file.exists():
+        meta = orjson.loads(meta_file.read_bytes())
+        if meta.get("ETag"):
+            headers["If-None-Match"] = meta["ETag"]
+        if meta.get("Last-Modified"):
+            headers["If-Modified-Since"] = meta["Last-Modified"]
+    return headers
+
+def _read_cached_json(cache_file: Path):
+    return orjson.loads(cache_file.read_bytes())
+
+def _store_validators(cache_file: Path, headers: httpx.Headers, meta_file: Path | None = None):
+    """Enregistre (ou efface) l'ETag et le Last-Modified associés à un fichier en cache"""
+    meta_file = meta_file or cache_file.with_suffix(".meta")
+    meta = {name: headers[name] for name in ("ETag", "Last-Modified") if name in headers}
+    if meta:
+        _write_atomic(meta_file, orjson.dumps(meta))
+    else:
+        meta_file.unlink(missing_ok=True)
+
+def _store_cached_json(cache_file: Path, content: bytes, headers: httpx.Headers):
+    """Sauvegarde la réponse et ses validateurs HTTP pour la prochaine requête"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(cache_file, content)
+    _store_validators(cache_file, headers)
+
+async def fetch_json_async(client: httpx.AsyncClient, url: str):
+    """Récupère un fichier JSON depuis une URL (requête conditionnelle si déjà en cache)
+
+    Hors-ligne, la copie en cache est renvoyée telle quelle si elle existe.
+    """
+    cache_file = _cache_file(url)
+    try:
+        resp = await client.get(url, headers=_conditional_headers(cache_file))
+    except httpx.TransportError:
+        if cache_file.exists():
+            return _read_cached_json(cache_file)
+        raise
+    if resp.status_code == 304:
+        return _read_cached_json(cache_file)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    _store_cached_json(cache_file, resp.content, resp.headers)
+    return data
+
+def refresh_json_cache():
+    """Vide le cache JSON si le patch a changé (vérifié au plus une fois toutes les 12 h)"""
+    version_file = CACHE_DIR / "_version.json"
+    state = {}
+    if version_file.exists():
+        with open(version_file, encoding="utf-8") as f:
+            state = json.load(f)
+        if time.time() - state.get("checked", 0) < VERSION_CHECK_INTERVAL:
+            return
+
+    resp = SESSION.get(DDRAGON_VERSIONS_URL, timeout=30)
     resp.raise_for_status()
-    return resp.json()
+    version = resp.json()[0]
+    if version != state.get("version"):
+        for f in CACHE_DIR.glob("*"):
+            if f != version_file:
+                f.unlink(missing_ok=True)
+        # Les splashs peuvent aussi changer d'un patch à l'autre
+        for f in IMG_CACHE_DIR.glob("*.jpg"):
+            f.unlink(missing_ok=True)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(version_file, json.dumps({"version": version, "checked": time.time()}).encode("utf-8"))
 
 def normalize_cdragon_path(path: str | None) -> str:
     """Formate l'URL pour qu'elle soit correcte, en fonction de la structure de l'API"""
     if not path:
         return ""
-    if path.startswith("http://") or path.startswith("https://"):
+    if path[:5] in ("http:", "https"):
         return path
     # Ajout d'un slash avant si nécessaire
-    if not path.startswith('/'):
-        path = '/' + path
-    return f"https://raw.communitydragon.org/latest{path}"
-
-def check_url_exists(url: str) -> bool:
-    """Vérifie si une URL existe en renvoyant True si le code de statut est 200"""
-    try:
-        response = requests.get(url, timeout=30)
-        return response.status_code == 200
-    except requests.exceptions.RequestException:
-        return False
+    return f"{CDRAGON_BASE}{path}" if path[0] == "/" else f"{CDRAGON_BASE}/{path}"
 
 # --------------------- Data access ---------------------------- #
 def get_champion_summary():
-    """Récupère la liste des champions via l'API CommunityDragon"""
-    return fetch_json("https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champion-summary.json")
+    """Récupère la liste des champions (id et nom uniquement) via l'API CommunityDragon
 
-def get_champion_detail(cid: int):
+    Le JSON est analysé au fil du téléchargement avec ijson : seuls les champs utiles
+    sont conservés, en mémoire comme dans le cache disque. Hors-ligne, la copie en
+    cache est renvoyée telle quelle si elle existe.
+    """
+    cache_file = _cache_file(CHAMPION_SUMMARY_URL)
+    try:
+        return _stream_champion_summary(CHAMPION_SUMMARY_URL, cache_file)
+    except httpx.TransportError:
+        if cache_file.exists():
+            return _read_cached_json(cache_file)
+        raise
+
+def _stream_champion_summary(url: str, cache_file: Path) -> list[dict]:
+    with SESSION.stream("GET", url, headers=_conditional_headers(cache_file), timeout=30) as resp:
+        if resp.status_code == 304:
+            return _read_cached_json(cache_file)
+        resp.raise_for_status()
+
+        champions = []
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, "item")
+        for chunk in resp.iter_bytes():
+            parser.send(chunk)
+            champions.extend({"id": c["id"], "name": c["name"]} for c in items)
+            del items[:]
+        parser.close()
+        champions.extend({"id": c["id"], "name": c["name"]} for c in items)
+        headers = resp.headers
+
+    _store_cached_json(cache_file, orjson.dumps(champions), headers)
+    return champions
+
+def _project_champion_detail(data: dict) -> dict:
+    """Ne garde du détail d'un champion que ce qu'utilise l'interface (skins, chromas, splashs)"""
+    return {
+        "id": data.get("id"),
+        "name": data.get("name"),
+        "skins": [
+            {
+                "name": s["name"],
+                "splashPath": s.get("splashPath"),
+                "isBase": s.get("isBase", False),
+                "chromas": [{"name": c["name"], "splashPath": c.get("splashPath")} for c in s.get("chromas", [])],
+            }
+            for s in data["skins"]
+        ],
+    }
+
+async def get_champion_detail_async(client: httpx.AsyncClient, cid: int):
     """Récupère les détails d'un champion via l'API CommunityDragon"""
-    return fetch_json(f"https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champions/{cid}.json")
+    return _project_champion_detail(await fetch_json_async(client, f"{CDRAGON_GAME_DATA}/champions/{cid}.json"))
+
+def _preview_suffix() -> str:
+    """Suffixe des aperçus sur disque : la taille en fait partie pour invalider les anciens"""
+    width, height = PREVIEW_SIZE
+    return f"_{width}x{height}.jpg"
+
+def _prune_img_cache():
+    """Ne garde sur disque que les IMG_DISK_CACHE_SIZE aperçus les plus récemment utilisés"""
+    suffix = _preview_suffix()
+    entries = []
+    for f in IMG_CACHE_DIR.glob("*.jpg"):
+        if not f.name.endswith(suffix):
+            f.unlink(missing_ok=True)  # aperçu d'une autre taille
+            continue
+        try:
+            entries.append((f.stat().st_mtime, f))
+        except FileNotFoundError:
+            pass  # supprimé entre-temps par un autre thread
+    entries.sort()
+    for _, f in entries[:-IMG_DISK_CACHE_SIZE]:
+        try:
+            f.unlink(missing_ok=True)
+        except PermissionError:
+            pass  # en cours de lecture par un autre thread (Windows) : supprimé au prochain passage
+
+def load_preview_image(url: str) -> Image.Image | None:
+    """Charge l'aperçu (au plus PREVIEW_SIZE) d'un splash (cache disque puis réseau), None si introuvable"""
+    img_file = IMG_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}{_preview_suffix()}"
+    try:
+        img_pil = Image.open(img_file)
+        img_pil.load()
+        os.utime(img_file)  # marque l'aperçu comme récemment utilisé
+        return img_pil
+    except FileNotFoundError:
+        pass  # absent, ou supprimé entre-temps par _prune_img_cache : on le retélécharge
+
+    # Un seul GET : le code de statut remplace la vérification préalable. Le splash
+    # (quelques centaines de Ko) est gardé en mémoire car draft() doit être appelé
+    # avant le décodage, ce qu'un décodage progressif (ImageFile.Parser) ne permet pas.
+    resp = SESSION.get(url, timeout=30)
+    if resp.status_code != 200:
+        return None
+    img_pil = Image.open(io.BytesIO(resp.content))
+    # draft() laisse libjpeg décoder directement à 1/2 ou 1/4 de la taille d'origine
+    img_pil.draft("RGB", PREVIEW_SIZE)
+    img_pil.thumbnail(PREVIEW_SIZE, Image.Resampling.BILINEAR)
+    img_pil = img_pil.convert("RGB")
+    buf = io.BytesIO()
+    img_pil.save(buf, "JPEG", quality=90)
+    IMG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(img_file, buf.getvalue())
+    _prune_img_cache()
+    return img_pil
 
 # ------------------- Télécharger le skin -------------------------- #
-def download_zip(champion: str, zip_name: str, target_dir: Path):
-    """Télécharge un skin ZIP depuis GitHub dans le répertoire cible"""
+def download_zip(champion: str, zip_name: str, target_dir: Path,
+                 progress: Callable[[int, int | None], None] | None = None,
+                 cancel: threading.Event | None = None):
+    """Télécharge un skin ZIP depuis GitHub dans le répertoire cible
+
+    Si le ZIP est déjà présent, la requête est conditionnelle (ETag / Last-Modified) et un 304
+    le réutilise tel quel. Sinon le fichier est écrit bloc par bloc ; ``progress(reçus, total)``
+    est appelé après chaque bloc (``total`` vaut None sans Content-Length). Si ``cancel``
+    est activé, le téléchargement s'interrompt au bloc suivant (InterruptedError).
+    """
     url = f"{GITHUB_ZIP_BASE}{champion}/{zip_name}"
-    response = requests.get(url, timeout=60)
-    response.raise_for_status()
-
-    # Sauvegarder le fichier ZIP dans le dossier de cache
     target_file = target_dir / f"{zip_name}"
-    with open(target_file, 'wb') as f:
-        f.write(response.content)
+    part_file = target_file.with_name(f"{target_file.name}.part")
+    meta_file = _zip_meta_file(url)  # hors du dossier du skin, visible par l'utilisateur
+    target_file.with_suffix(".etag").unlink(missing_ok=True)  # ancien emplacement de l'ETag
+
+    with SESSION.stream("GET", url, headers=_conditional_headers(target_file, meta_file), timeout=60) as response:
+        if response.status_code == 304:
+            return target_file
+        response.raise_for_status()
+        headers = response.headers
+        total = int(response.headers["Content-Length"]) if "Content-Length" in response.headers else None
+        received = 0
+        # Sauvegarder le fichier ZIP dans le dossier de cache sans le garder en mémoire
+        try:
+            with open(part_file, 'wb') as f:
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if cancel is not None and cancel.is_set():
+                        raise InterruptedError("Téléchargement annulé")
+                    f.write(chunk)
+                    received += len(chunk)
+                    if progress:
+                        progress(received, total)
+        except BaseException:
+            part_file.unlink(missing_ok=True)
+            raise
+    os.replace(part_file, target_file)
+    ZIP_META_DIR.mkdir(parents=True, exist_ok=True)
+    _store_validators(target_file, headers, meta_file)
     return target_file
 
 def open_explorer(path: Path):
     """Ouvre l'explorateur de fichiers dans le répertoire spécifié"""
     if os.name == 'nt':  # Si l'OS est Windows
-        subprocess.Popen(f'explorer /select,"{path}"')
+        # Arguments en liste : pas d'échappement à gérer pour les guillemets ou l'Unicode
+        subprocess.Popen(["explorer", "/select,", str(path)])
 
 # --------------------------- GUI ------------------------------ #
 
@@ -81,6 +345,30 @@ class SkinChangerApp(tk.Tk):
         # Data caches
         self.champions: list[dict] = []
         self.current_champion_data: dict | None = None
+        self._champ_by_name: dict[str, dict] = {}
+        self._skin_by_name: dict[str, dict] = {}
+
+        # Pool unique pour les tâches de fond (borne le nombre de threads)
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="skin")
+        self._closing = threading.Event()  # interrompt les téléchargements à la fermeture
+
+        # Requêtes en cours, pour qu'un même chargement ne parte qu'une fois
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._detail_cache: dict[int, Future] = {}  # détails des champions, chargés ou en cours
+        self._detail_urgent: set[int] = set()  # champions dont une requête hors file est partie
+        self._pending_jobs: dict[str, str] = {}  # after() en attente, par clé de debounce
+        self._wanted_preview: str | None = None  # URL de l'aperçu attendu à l'écran
+        self._img_cache: OrderedDict[str, ImageTk.PhotoImage] = OrderedDict()
+
+        # Boucle asyncio dédiée aux rafales de requêtes HTTP (préchargement)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._async_client = httpx.AsyncClient(http2=True, limits=ASYNC_LIMITS, timeout=30, follow_redirects=True)
+        self._prefetch_semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+        # Tk n'est pas thread-safe : les workers postent leurs mises à jour ici
+        self._ui_queue: queue.Queue = queue.Queue()
 
         # UI variables
         self.var_champion = tk.StringVar()
@@ -91,8 +379,32 @@ class SkinChangerApp(tk.Tk):
         self._ensure_skin_cache_exists()
 
         self._build_widgets()
+        self.after(50, self._drain_ui_queue)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._executor.submit(warm_up_connections)
+        asyncio.run_coroutine_threadsafe(warm_up_connections_async(self._async_client), self._loop)
         self._populate_champions_async()
 
+    def _on_close(self):
+        """Annule les tâches de fond puis ferme la fenêtre
+
+        Les workers du pool ne sont pas des threads daemon : Python les attend à la sortie.
+        Rien ne doit donc rester bloqué indéfiniment une fois la fenêtre fermée.
+        """
+        self._closing.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # Solde les détails de champion en attente avant que la boucle asyncio
+        # ne s'arrête et ne puisse plus les terminer
+        with self._inflight_lock:
+            for future in self._detail_cache.values():
+                future.cancel()
+        asyncio.run_coroutine_threadsafe(self._close_async(), self._loop)
+        self.destroy()
+
+    async def _close_async(self):
+        await self._async_client.aclose()
+        asyncio.get_running_loop().stop()
+
     def _ensure_skin_cache_exists(self):
         """Vérifie si le dossier de cache existe, sinon il est créé."""
         Path(LOCAL_SKIN_CACHE).mkdir(parents=True, exist_ok=True)
@@ -105,6 +417,9 @@ class SkinChangerApp(tk.Tk):
         self.cmb_champion = ttk.Combobox(self, textvariable=self.var_champion, state="readonly", width=30)
         self.cmb_champion.grid(row=0, column=1, **padding)
         self.cmb_champion.bind("<<ComboboxSelected>>", self.on_champion_selected)
+        # Liste déroulante : le champion surligné au clavier ou à la souris est préchargé
+        self.bind_class("ComboboxListbox", "<KeyRelease>", self.on_champion_highlighted, add="+")
+        self.bind_class("ComboboxListbox", "<Motion>", self.on_champion_highlighted, add="+")
 
         ttk.Label(self, text="Skin :").grid(row=1, column=0, sticky="w", **padding)
         self.cmb_skin = ttk.Combobox(self, textvariable=self.var_skin, state="readonly", width=30)
@@ -129,61 +444,204 @@ class SkinChangerApp(tk.Tk):
         self.var_status = tk.StringVar(value="Chargement des champions…")
         ttk.Label(self, textvariable=self.var_status).grid(row=5, column=0, columnspan=2)
 
+    # ------------ Thread UI ---------------
+    def _post_ui(self, func, *args):
+        """Planifie un appel dans le thread Tk (utilisable depuis n'importe quel thread)"""
+        self._ui_queue.put(partial(func, *args))
+
+    def _drain_ui_queue(self):
+        """Exécute les mises à jour d'interface postées par les workers"""
+        try:
+            while True:
+                try:
+                    callback = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                callback()
+        finally:
+            self.after(50, self._drain_ui_queue)
+
     # --------------- Events -------------------
+    def _debounce(self, key: str, delay_ms: int, func, *args):
+        """Planifie func(*args) dans delay_ms ; un nouvel appel avec la même clé remplace le précédent"""
+        job = self._pending_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+
+        def run():
+            self._pending_jobs.pop(key, None)
+            func(*args)
+        self._pending_jobs[key] = self.after(delay_ms, run)
+
     def on_champion_selected(self, _):
+        # Flèche maintenue : seul le dernier champion sélectionné est chargé
+        self._debounce("champion", 150, self._do_champion_load)
+
+    def _do_champion_load(self):
         champ_name = self.var_champion.get()
         if not champ_name:
             return
-        champ = next((c for c in self.champions if c["name"] == champ_name), None)
+        champ = self._champ_by_name.get(champ_name)
         if champ is None:
             return
         self.var_status.set("Chargement des skins…")
-        threading.Thread(target=self._load_champ_data, args=(champ["id"],), daemon=True).start()
+        # Le Future partagé par champion suffit à regrouper les demandes : aucun worker n'attend
+        self._detail_future(champ["id"]).add_done_callback(lambda f: self._on_champ_data_loaded(champ_name, f))
+
+    def on_champion_highlighted(self, event):
+        # La liste déroulante de cmb_champion a pour chemin <cmb_champion>.popdown.f.l
+        if not str(event.widget).startswith(f"{self.cmb_champion}."):
+            return
+        self._debounce("prefetch", 120, self._prefetch_highlighted, str(event.widget))
+
+    def _prefetch_highlighted(self, listbox: str):
+        try:
+            selection = self.tk.splitlist(self.tk.call(listbox, "curselection"))
+            if not selection:
+                return
+            champ = self._champ_by_name.get(self.tk.call(listbox, "get", selection[0]))
+        except tk.TclError:
+            return
+        if champ is not None and champ["id"] >= 0:
+            self._detail_future(champ["id"])
 
     def on_skin_selected(self, _):
         skin_name = self.var_skin.get()
         if not skin_name or not self.current_champion_data:
             return
-        skin = next((s for s in self.current_champion_data["skins"] if s["name"] == skin_name), None)
+        skin = self._skin_by_name.get(skin_name)
         if skin is None:
             return
         chroma_names = [c["name"] for c in skin.get("chromas", [])]
         self.cmb_chroma["values"] = chroma_names or ["—"]
         self.var_chroma.set(chroma_names[0] if chroma_names else "—")
-        self._show_image_async(skin.get("splashPath"))
+        self._debounce("preview", 150, self._show_image_async, skin.get("splashPath"))
 
     def on_chroma_selected(self, _):
         chroma_name = self.var_chroma.get()
         if chroma_name in ("—", ""):
             return
-        skin = next((s for s in self.current_champion_data["skins"] if s["name"] == self.var_skin.get()), None)
+        skin = self._skin_by_name.get(self.var_skin.get())
         if not skin:
             return
-        chroma = next((c for c in skin.get("chromas", []) if c["name"] == chroma_name), None)
+        chroma = skin["_chroma_by_name"].get(chroma_name)
         if chroma:
-            self._show_image_async(chroma.get("splashPath"))
+            self._debounce("preview", 150, self._show_image_async, chroma.get("splashPath"))
 
     # --------------- Async tasks -------------------
+    def _coalesced(self, key: str, func, *args) -> Future:
+        """Exécute func(*args) dans le pool, ou renvoie le Future déjà en cours pour la même clé"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._inflight[key] = self._executor.submit(func, *args)
+
+        def forget(done: Future):
+            with self._inflight_lock:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+        future.add_done_callback(forget)
+        return future
+
     def _populate_champions_async(self):
         def task():
             try:
-                self.champions = sorted(get_champion_summary(), key=lambda c: c["name"])
-                self.cmb_champion["values"] = [c["name"] for c in self.champions]
-                self.var_status.set("Choisissez un champion.")
+                try:
+                    refresh_json_cache()
+                except (httpx.HTTPError, ValueError, OSError):
+                    pass  # hors-ligne ou cache illisible : on garde le cache existant
+                champions = get_champion_summary()
+                for c in champions:
+                    c["name"] = sys.intern(c["name"])  # partagés avec les index et la combobox
+                self.champions = sorted(champions, key=itemgetter("name"))
+                names = tuple(map(itemgetter("name"), self.champions))
+                self._champ_by_name = {c["name"]: c for c in self.champions}
+                self._post_ui(self._apply_champions, names)
+                self._prefetch_champion_details()
             except Exception as e:
-                self.var_status.set(f"Erreur chargement champions : {e}")
-        threading.Thread(target=task, daemon=True).start()
-
-    def _load_champ_data(self, cid: int):
+                self._post_ui(self.var_status.set, f"Erreur chargement champions : {e}")
+        self._executor.submit(task)
+
+    def _apply_champions(self, names: tuple[str, ...]):
+        self.cmb_champion["values"] = names
+        self.var_status.set("Choisissez un champion.")
+
+    def _prefetch_champion_details(self):
+        """Précharge en arrière-plan les détails de tous les champions dans le cache"""
+        for champ in self.champions:
+            if champ["id"] >= 0:  # -1 = entrée « None » du résumé
+                self._detail_future(champ["id"], background=True)
+
+    def _detail_future(self, cid: int, background: bool = False) -> Future:
+        """Future du détail d'un champion, rempli par la première requête qui aboutit
+
+        Un chargement en échec est relancé à l'appel suivant. En ``background`` la requête
+        attend son tour derrière ``_prefetch_semaphore`` ; sinon (champion survolé ou choisi)
+        une requête hors file part tout de suite, même si le préchargement l'a déjà mis en file.
+        """
+        with self._inflight_lock:
+            future = self._detail_cache.get(cid)
+            if future is None or (future.done() and (future.cancelled() or future.exception() is not None)):
+                future = self._detail_cache[cid] = Future()
+                self._detail_urgent.discard(cid)
+                if background:
+                    asyncio.run_coroutine_threadsafe(self._fetch_detail_async(cid, future, gated=True), self._loop)
+            if not background and not future.done() and cid not in self._detail_urgent:
+                self._detail_urgent.add(cid)
+                asyncio.run_coroutine_threadsafe(self._fetch_detail_async(cid, future, gated=False), self._loop)
+        return future
+
+    async def _fetch_detail_async(self, cid: int, future: Future, gated: bool):
+        """Charge le détail d'un champion dans ``future`` si aucune autre requête ne l'a déjà fait"""
+        try:
+            if gated:
+                async with self._prefetch_semaphore:
+                    if future.done():
+                        return  # déjà chargé par une requête hors file
+                    data = await get_champion_detail_async(self._async_client, cid)
+            else:
+                data = await get_champion_detail_async(self._async_client, cid)
+        except Exception as e:
+            settle = partial(future.set_exception, e)
+        else:
+            settle = partial(future.set_result, data)
         try:
-            self.current_champion_data = get_champion_detail(cid)
-            skins = [s["name"] for s in self.current_champion_data["skins"] if not s.get("isBase", False)]
-            self.cmb_skin["values"] = skins
-            self.var_skin.set("")
-            self.cmb_chroma["values"] = []
-            self.var_chroma.set("")
-            self.var_status.set("Sélectionnez un skin.")
+            settle()
+        except InvalidStateError:
+            pass  # l'autre requête a fini la première, ou la fenêtre se ferme
+
+    @staticmethod
+    def _index_champ_data(data: dict) -> tuple[dict, list[str], dict[str, dict]]:
+        skins = [s["name"] for s in data["skins"] if not s.get("isBase", False)]
+        skin_by_name = {}
+        for s in data["skins"]:
+            s["_chroma_by_name"] = {c["name"]: c for c in s.get("chromas", [])}
+            skin_by_name[s["name"]] = s
+        return data, skins, skin_by_name
+
+    def _on_champ_data_loaded(self, champ_name: str, future: Future):
+        """Appelé (boucle asyncio ou thread Tk) dès que le détail du champion est disponible"""
+        try:
+            self._post_ui(self._apply_champ_data, champ_name, *self._index_champ_data(future.result()))
+        except CancelledError:
+            pass  # fenêtre en cours de fermeture
         except Exception as e:
+            self._post_ui(self._apply_champ_error, champ_name, e)
+
+    def _apply_champ_data(self, champ_name: str, data: dict, skins: list[str], skin_by_name: dict[str, dict]):
+        if self.var_champion.get() != champ_name:
+            return  # réponse périmée : un autre champion a été choisi entre-temps
+        self.current_champion_data = data
+        self._skin_by_name = skin_by_name
+        self.cmb_skin["values"] = skins
+        self.var_skin.set("")
+        self.cmb_chroma["values"] = []
+        self.var_chroma.set("")
+        self.var_status.set("Sélectionnez un skin.")
+
+    def _apply_champ_error(self, champ_name: str, e: Exception):
+        if self.var_champion.get() == champ_name:
             self.var_status.set(f"Erreur chargement skins : {e}")
 
     # --------------- Télécharger le skin -------------------
@@ -194,42 +652,87 @@ class SkinChangerApp(tk.Tk):
             messagebox.showwarning("Sélection manquante", "Choisissez un champion et un skin.")
             return
 
+        def progress(received: int, total: int | None):
+            if total:
+                text = f"Téléchargement… {min(received * 100 // total, 100)} %"
+            else:
+                text = f"Téléchargement… {received / (1 << 20):.1f} Mo"
+            self._post_ui(self.var_status.set, text)
+
         def task():
             try:
-                self.var_status.set("Téléchargement…")
                 skin_cache_dir = Path(LOCAL_SKIN_CACHE)
-                downloaded_file = download_zip(champ, f"{skin}.zip", skin_cache_dir)
-                self.var_status.set("Téléchargement terminé.")
-                messagebox.showinfo("Succès", f"Le skin '{skin}' a été téléchargé.")
-                open_explorer(downloaded_file)
+                downloaded_file = download_zip(champ, f"{skin}.zip", skin_cache_dir, progress, self._closing)
+                self._post_ui(self._on_download_done, skin, downloaded_file)
             except Exception as e:
-                self.var_status.set("Erreur téléchargement")
-                messagebox.showerror("Erreur", str(e))
-        threading.Thread(target=task, daemon=True).start()
+                self._post_ui(self._on_download_error, e)
+        self.var_status.set("Téléchargement…")
+        self._executor.submit(task)
+
+    def _on_download_done(self, skin: str, downloaded_file: Path):
+        self.var_status.set("Téléchargement terminé.")
+        messagebox.showinfo("Succès", f"Le skin '{skin}' a été téléchargé.")
+        open_explorer(downloaded_file)
+
+    def _on_download_error(self, e: Exception):
+        self.var_status.set("Erreur téléchargement")
+        messagebox.showerror("Erreur", str(e))
 
     def open_skin_folder(self):
         """Ouvre l'explorateur de fichiers dans le répertoire des skins téléchargés"""
-        open_explorer(Path(LOCAL_SKIN_CACHE))
+        if os.name == 'nt':  # Si l'OS est Windows
+            os.startfile(LOCAL_SKIN_CACHE)
 
     # --------------- Show image -------------------
     def _show_image_async(self, path: str | None):
         url = normalize_cdragon_path(path)
-        if not url or not check_url_exists(url):  # Vérifier si l'URL existe réellement
+        self._wanted_preview = url
+        if not url:
             self.preview_label.configure(text="[Impossible d'afficher l'image]")
             return
 
-        def task():
-            try:
-                img_data = requests.get(url, timeout=30)
-                img_data.raise_for_status()
-                img_pil = Image.open(io.BytesIO(img_data.content)).resize((512, 288))
-                photo = ImageTk.PhotoImage(img_pil)
-                self.preview_label.image = photo  # préserve la référence
-                self.preview_label.configure(image=photo, text="")
-            except Exception as e:
-                # conserve l’image précédente, affiche juste le message en overlay
-                self.preview_label.configure(text=f"[Impossible d'afficher] {e}")
-        threading.Thread(target=task, daemon=True).start()
+        # Aperçu déjà décodé : affichage immédiat, sans thread ni réseau
+        photo = self._img_cache.get(url)
+        if photo is not None:
+            self._img_cache.move_to_end(url)
+            self._set_preview(photo)
+            return
+
+        future = self._coalesced(url, load_preview_image, url)
+        future.add_done_callback(lambda f: self._on_preview_loaded(url, f))
+
+    def _on_preview_loaded(self, url: str, future: Future):
+        try:
+            img_pil = future.result()
+        except CancelledError:
+            return  # fenêtre en cours de fermeture
+        except Exception as e:
+            # conserve l’image précédente, affiche juste le message en overlay
+            self._post_ui(self._show_preview_error, url, f"[Impossible d'afficher] {e}")
+            return
+        if img_pil is None:
+            self._post_ui(self._show_preview_error, url, "[Impossible d'afficher l'image]")
+            return
+        # PhotoImage ne doit être créé que dans le thread Tk
+        self._post_ui(self._cache_preview, url, img_pil)
+
+    def _cache_preview(self, url: str, img_pil: Image.Image):
+        """Convertit l'aperçu en PhotoImage, l'ajoute au cache LRU et l'affiche"""
+        photo = ImageTk.PhotoImage(img_pil)
+        self._img_cache[url] = photo
+        self._img_cache.move_to_end(url)
+        if len(self._img_cache) > IMG_CACHE_SIZE:
+            self._img_cache.popitem(last=False)
+        if url == self._wanted_preview:
+            self._set_preview(photo)
+
+    def _show_preview_error(self, url: str, text: str):
+        if url == self._wanted_preview:
+            self.preview_label.configure(text=text)
+
+    def _set_preview(self, photo: ImageTk.PhotoImage):
+        self.preview_label.image = photo  # préserve la référence
+        self.preview_label.configure(image=photo, text="")
 
 if __name__ == "__main__":
     SkinChangerApp().mainloop()